@@ -1,12 +1,36 @@
 """Nox configuration file."""
 
+import hashlib
+import os
+
 import nox
 
+nox.options.sessions = ["test", "lint", "black", "typecheck"]
+
+
+def poetry_install(session: nox.Session, *args: str):
+    """Run poetry install, skipping it if poetry.lock is unchanged since the last run."""
+    with open("poetry.lock", "rb") as lock_file:
+        digest = hashlib.sha256(lock_file.read())
+    digest.update(" ".join(args).encode())
+
+    marker = os.path.join(session.create_tmp(), "poetry-lock.sha256")
+    if os.path.exists(marker):
+        with open(marker, encoding="utf-8") as marker_file:
+            if marker_file.read() == digest.hexdigest():
+                session.log("poetry.lock unchanged, skipping install")
+                return
+
+    session.run("poetry", "install", *args, external=True)
+
+    with open(marker, "w", encoding="utf-8") as marker_file:
+        marker_file.write(digest.hexdigest())
+
 
 @nox.session(python=["3.8", "3.9", "3.10", "3.11"], reuse_venv=True)
 def test(session: nox.Session):
     """Run the test suite."""
-    session.run("poetry", "install", "--without", "dev", "--sync", external=True)
+    poetry_install(session, "--without", "dev", "--sync")
 
     session.run("pytest", "tests/")
 
@@ -14,7 +38,7 @@ def test(session: nox.Session):
 @nox.session(reuse_venv=True)
 def lint(session: nox.Session):
     """Run pylint."""
-    session.run("poetry", "install", "--sync", external=True)
+    poetry_install(session, "--sync")
 
     session.run("pylint", "src/", "tests/", "noxfile.py")
 
@@ -22,7 +46,7 @@ def lint(session: nox.Session):
 @nox.session(reuse_venv=True)
 def black(session: nox.Session):
     """Run black."""
-    session.run("poetry", "install", "--sync", external=True)
+    poetry_install(session, "--sync")
 
     session.run("black", "src/", "tests/", "noxfile.py", "--check")
 
@@ -30,6 +54,6 @@ def black(session: nox.Session):
 @nox.session(reuse_venv=True)
 def typecheck(session: nox.Session):
     """Run mypy."""
-    session.run("poetry", "install", "--sync", external=True)
+    poetry_install(session, "--sync")
 
     session.run("pyright")